@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+import queue
 import signal
 import sys
-from concurrent.futures import ThreadPoolExecutor
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 
+from dotenv import load_dotenv
 from PyQt6 import QtCore, QtGui, QtWidgets
 
-from whisperfree.audio import AudioRecorder
+from whisperfree.audio import AudioRecorder, concat_wav, invalidate_device_cache, list_microphones
 from whisperfree.config import AppConfig, load_config
 from whisperfree.history import TranscriptionHistory
 from whisperfree.hotkeys import HotkeyListener
@@ -25,6 +27,74 @@ from whisperfree.utils.logger import get_logger, setup_logging
 logger = get_logger(__name__)
 
 
+class TranscriptionWorker(QtCore.QObject):
+    """Transcribe queued recordings one at a time on a dedicated thread."""
+
+    result_ready = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, transcriber: TranscriptionRouter, max_pending: int = 2) -> None:
+        super().__init__()
+        self._transcriber = transcriber
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=max_pending)
+
+    def submit(self, audio_bytes: bytes) -> bool:
+        """Queue a recording, dropping the oldest pending one if full. Returns False when a job was dropped."""
+        dropped = False
+        while True:
+            try:
+                self._queue.put_nowait(audio_bytes)
+                return not dropped
+            except queue.Full:
+                dropped = self._discard_oldest() or dropped
+
+    def stop(self) -> None:
+        """Discard pending recordings and let the worker loop exit."""
+        while self._discard_oldest():
+            pass
+        self._queue.put(None)
+
+    def _discard_oldest(self) -> bool:
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            return False
+        return True
+
+    def run(self) -> None:
+        """Worker loop; returns once ``stop()`` has been called and the in-flight job has finished."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            # Recordings that piled up while the previous request was in flight go out as one API call.
+            batch: List[bytes] = [job]
+            stopping = False
+            while True:
+                try:
+                    pending = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stopping = True
+                    break
+                batch.append(pending)
+            payload = batch[0] if len(batch) == 1 else concat_wav(batch)
+            self._transcribe(payload, len(batch))
+            if stopping:
+                return
+
+    def _transcribe(self, audio_bytes: bytes, recordings: int) -> None:
+        logger.info("Processing transcription payload of {} bytes ({} recordings)", len(audio_bytes), recordings)
+        try:
+            result = self._transcriber.transcribe(audio_bytes)
+        except Exception as exc:
+            logger.exception("Transcription failed: %s", exc)
+            self.failed.emit(str(exc))
+            return
+        self.result_ready.emit(result.text)
+
+
 class WhisperFreeController(QtCore.QObject):
     """Glue between input devices, transcription engines, and UI."""
 
@@ -39,6 +109,11 @@ class WhisperFreeController(QtCore.QObject):
         super().__init__()
         self._app = app
         self._config = config
+        self._mic_device_name = config.mic_device_name
+        self._pending_level = 0.0
+        self._level_flush_pending = False
+        self._pending_waveform: Optional[tuple] = None
+        self._waveform_flush_pending = False
         self._overlay = OverlayWindow()
         if self._config.overlay_enabled:
             self._overlay.show_idle()
@@ -51,14 +126,21 @@ class WhisperFreeController(QtCore.QObject):
         self.idle_requested.connect(self._overlay.show_idle)
         self.recording_requested.connect(self._overlay.show_recording)
 
-        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="whisperfree")
         self._transcriber = TranscriptionRouter(config)
+        self._worker = TranscriptionWorker(self._transcriber)
+        self._worker.result_ready.connect(self._handle_transcription_result)
+        self._worker.failed.connect(self._handle_transcription_failed)
+        # A daemon thread rather than a QThread: an API call can block for minutes, and Qt aborts the process if a
+        # running QThread is destroyed, whereas a daemon thread is simply abandoned at interpreter exit.
+        self._worker_thread = threading.Thread(target=self._worker.run, name="whisperfree-transcribe", daemon=True)
+        self._worker_thread.start()
         self._history = TranscriptionHistory()
         self._audio = AudioRecorder(
             config=config,
             level_callback=self._handle_level_update,
             waveform_callback=self._handle_waveform_update,
         )
+        self._prewarm_audio()
 
         self._hotkeys = HotkeyListener(
             on_start=self._handle_push_to_talk_start,
@@ -81,8 +163,12 @@ class WhisperFreeController(QtCore.QObject):
         """Gracefully shut down."""
         logger.info("Shutting down WhisperFree.")
         self._hotkeys.stop()
-        self._audio.stop()
-        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._audio.close()
+        self._worker.stop()
+        self._worker_thread.join(timeout=2.0)
+        if self._worker_thread.is_alive():
+            logger.warning("Transcription still in flight at shutdown; abandoning it.")
+        self._history.close()
         self._app.quit()
 
     def open_settings(self) -> None:
@@ -101,16 +187,46 @@ class WhisperFreeController(QtCore.QObject):
 
     def _handle_config_saved(self, config: AppConfig) -> None:
         logger.info("Configuration saved.")
+        if config.mic_device_name != self._mic_device_name:
+            self._mic_device_name = config.mic_device_name
+            invalidate_device_cache()
+        self._prewarm_audio()
         if config.overlay_enabled:
             self._overlay.show_idle()
         else:
             self._overlay.hide_overlay()
 
+    def _prewarm_audio(self) -> None:
+        # Opening the device is the slow part of starting a recording, so do it ahead of the first hotkey press.
+        try:
+            self._audio.open()
+        except Exception as exc:
+            logger.warning("Unable to pre-open audio input: {}", exc)
+
     def _handle_level_update(self, value: float) -> None:
-        self.level_changed.emit(value)
+        # Runs on the audio thread: keep only the latest level and post at most one flush to the GUI thread.
+        self._pending_level = value
+        if not self._level_flush_pending:
+            self._level_flush_pending = True
+            QtCore.QMetaObject.invokeMethod(self, "_flush_level", QtCore.Qt.ConnectionType.QueuedConnection)
+
+    @QtCore.pyqtSlot()
+    def _flush_level(self) -> None:
+        self._level_flush_pending = False
+        self.level_changed.emit(self._pending_level)
 
     def _handle_waveform_update(self, samples, sample_rate: int) -> None:
-        self.waveform_chunk.emit((samples, sample_rate))
+        self._pending_waveform = (samples, sample_rate)
+        if not self._waveform_flush_pending:
+            self._waveform_flush_pending = True
+            QtCore.QMetaObject.invokeMethod(self, "_flush_waveform", QtCore.Qt.ConnectionType.QueuedConnection)
+
+    @QtCore.pyqtSlot()
+    def _flush_waveform(self) -> None:
+        self._waveform_flush_pending = False
+        payload, self._pending_waveform = self._pending_waveform, None
+        if payload is not None:
+            self.waveform_chunk.emit(payload)
 
     def _handle_push_to_talk_start(self) -> None:
         logger.info("Push-to-talk activated.")
@@ -133,20 +249,15 @@ class WhisperFreeController(QtCore.QObject):
                 self.idle_requested.emit()
             return
         # self.toast_requested.emit("Transcribing…", 1200)
-        self._executor.submit(self._process_session, audio_bytes)
-
-    def _process_session(self, audio_bytes: bytes) -> None:
-        logger.info("Processing transcription payload of {} bytes", len(audio_bytes))
-        try:
-            result = self._transcriber.transcribe(audio_bytes)
-        except Exception as exc:
-            logger.exception("Transcription failed: %s", exc)
-            self.toast_requested.emit("Transcription failed", 2500)
-            self.idle_requested.emit()
-            return
+        if not self._worker.submit(audio_bytes):
+            self.toast_requested.emit("Dropped an earlier recording", 2000)
 
-        transcribed_text = result.text
+    def _handle_transcription_failed(self, message: str) -> None:
+        _ = message
+        self.toast_requested.emit("Transcription failed", 2500)
+        self.idle_requested.emit()
 
+    def _handle_transcription_result(self, transcribed_text: str) -> None:
         if not transcribed_text.strip():
             self.toast_requested.emit("Nothing to paste", 2000)
             self.idle_requested.emit()
@@ -179,7 +290,10 @@ def _install_signal_handlers(controller: WhisperFreeController) -> None:
 def main() -> None:
     """Launch the WhisperFree desktop app."""
     setup_logging()
+    load_dotenv()
     config = load_config()
+    # Enumerate devices once up front so the first push-to-talk resolves the microphone from cache.
+    list_microphones()
 
     app = QtWidgets.QApplication(sys.argv)
     app.setApplicationName("WhisperFree")
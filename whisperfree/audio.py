@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import io
+import struct
 import threading
-import wave
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import sounddevice as sd
@@ -17,9 +16,56 @@ from whisperfree.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_BUFFER_SECONDS = 120
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _build_wav_header(sample_rate: int, n_frames: int) -> bytes:
+    """Return the 44-byte RIFF header for mono 16-bit PCM."""
+    data_size = 2 * n_frames
+    return _WAV_HEADER.pack(
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        1,
+        sample_rate,
+        sample_rate * 2,
+        2,
+        16,
+        b"data",
+        data_size,
+    )
+
+
+_device_cache: Dict[str, int] = {}
+_device_cache_lock = threading.Lock()
+
+
+def _cache_input_devices(devices) -> List[str]:
+    """Replace the name -> index cache from a device listing and return the input device names."""
+    indices: Dict[str, int] = {}
+    names: List[str] = []
+    for idx, device in enumerate(devices):
+        if device.get("max_input_channels", 0) > 0:
+            names.append(device["name"])
+            indices.setdefault(device["name"], idx)
+    with _device_cache_lock:
+        _device_cache.clear()
+        _device_cache.update(indices)
+    return names
+
+
+def invalidate_device_cache() -> None:
+    """Forget resolved device indices so the next lookup re-enumerates PortAudio devices."""
+    with _device_cache_lock:
+        _device_cache.clear()
+
 
 def list_microphones() -> List[str]:
-    """Return a list of input-capable device names."""
+    """Return a list of input-capable device names, refreshing the device index cache."""
     try:
         devices = sd.query_devices()
     except sd.PortAudioError as exc:
@@ -28,17 +74,17 @@ def list_microphones() -> List[str]:
     except Exception as exc:  # pragma: no cover - defensive
         logger.bind(error=str(exc)).exception("Unexpected error while querying audio devices.")
         return []
-    names: List[str] = []
-    for device in devices:
-        if device.get("max_input_channels", 0) > 0:
-            names.append(device["name"])
-    return names
+    return _cache_input_devices(devices)
 
 
 def resolve_device(device_name: Optional[str]) -> Optional[int]:
-    """Translate a device name to a sounddevice index."""
+    """Translate a device name to a sounddevice index, enumerating devices only on a cache miss."""
     if device_name is None:
         return None
+    with _device_cache_lock:
+        cached = _device_cache.get(device_name)
+    if cached is not None:
+        return cached
     try:
         devices = sd.query_devices()
     except sd.PortAudioError as exc:
@@ -47,10 +93,32 @@ def resolve_device(device_name: Optional[str]) -> Optional[int]:
     except Exception as exc:  # pragma: no cover - defensive
         logger.bind(error=str(exc)).exception("Unexpected error while resolving audio device %s", device_name)
         return None
-    for idx, device in enumerate(devices):
-        if device.get("name") == device_name and device.get("max_input_channels", 0) > 0:
-            return idx
-    return None
+    _cache_input_devices(devices)
+    with _device_cache_lock:
+        return _device_cache.get(device_name)
+
+
+def _apply_gain(frame: np.ndarray, gain: float, scratch: np.ndarray) -> None:
+    """Scale int16 samples in place, clipping to the int16 range via a float32 scratch buffer."""
+    samples = frame.reshape(-1)
+    work = scratch[: samples.size]
+    np.multiply(samples, gain, out=work, dtype=np.float32)
+    np.clip(work, -32768, 32767, out=work)
+    np.copyto(samples, work, casting="unsafe")
+
+
+def concat_wav(payloads: Sequence[bytes]) -> memoryview:
+    """Join WAV payloads produced by :meth:`AudioRecorder.get_wav_bytes` into a single recording."""
+    header_size = _WAV_HEADER.size
+    sample_rate = _WAV_HEADER.unpack_from(payloads[0])[7]
+    merged = bytearray(header_size + sum(len(payload) - header_size for payload in payloads))
+    merged[:header_size] = _build_wav_header(sample_rate, (len(merged) - header_size) // 2)
+    offset = header_size
+    for payload in payloads:
+        pcm = memoryview(payload)[header_size:]
+        merged[offset : offset + len(pcm)] = pcm
+        offset += len(pcm)
+    return memoryview(merged)
 
 
 LevelCallback = Callable[[float], None]
@@ -73,101 +141,159 @@ class AudioRecorder:
         self._waveform_callback = waveform_callback
         self._block_duration_ms = block_duration_ms
         self._keep_last_path = keep_last_path
-        self._buffer: List[np.ndarray] = []
+        self._ring = np.empty(0, dtype=np.int16)
+        self._write_idx = 0
         self._lock = threading.RLock()
         self._stream: Optional[sd.InputStream] = None
-        self._frames_recorded = 0
+        self._stream_settings: Optional[Tuple[Optional[str], int]] = None
         self._smoother = LevelSmoother()
+        self._gain_scratch = np.empty(0, dtype=np.float32)
+        self._gain_db_cached: Optional[float] = None
+        self._gain_multiplier_cached = 1.0
 
     @property
     def gain_multiplier(self) -> float:
         """Return the linear multiplier derived from the configured gain in dB."""
-        return float(10 ** (self._config.input_gain_db / 20.0))
+        gain_db = self._config.input_gain_db
+        if gain_db != self._gain_db_cached:
+            self._gain_db_cached = gain_db
+            self._gain_multiplier_cached = float(10 ** (gain_db / 20.0))
+        return self._gain_multiplier_cached
+
+    def open(self) -> None:
+        """Create the input stream for the configured device without starting capture."""
+        with self._lock:
+            self._open_locked()
+
+    def _open_locked(self) -> None:
+        settings = (self._config.mic_device_name, self._config.sample_rate)
+        if self._stream is not None:
+            if settings == self._stream_settings or self._stream.active:
+                return
+            self._close_locked()
+        capacity = self._config.sample_rate * _BUFFER_SECONDS
+        if self._ring.size < capacity:
+            self._ring = np.empty(capacity, dtype=np.int16)
+
+        device_index = resolve_device(self._config.mic_device_name)
+        requested = max(int(self._config.sample_rate * self._block_duration_ms / 1000), 80)
+        # Round up to a power of two so blocks line up with the host API's native buffer periods.
+        blocksize = 1 << (requested - 1).bit_length()
+        if self._gain_scratch.size < blocksize:
+            self._gain_scratch = np.empty(blocksize, dtype=np.float32)
+        logger.info(
+            "Opening audio stream device={} index={} sample_rate={} blocksize={}",
+            self._config.mic_device_name or "default",
+            device_index,
+            self._config.sample_rate,
+            blocksize,
+        )
+        try:
+            self._stream = sd.InputStream(
+                device=device_index,
+                channels=1,
+                samplerate=self._config.sample_rate,
+                blocksize=blocksize,
+                dtype="int16",
+                latency="low",
+                callback=self._callback,
+            )
+        except Exception as exc:  # pragma: no cover - runtime safeguard
+            logger.bind(error=str(exc)).exception("Failed to open audio stream")
+            self._stream = None
+            # The cached index may point at a device that has since gone away.
+            invalidate_device_cache()
+            raise
+        self._stream_settings = settings
+        logger.info("Audio stream input latency={:.1f} ms", self._stream.latency * 1000)
 
     def start(self) -> None:
-        """Begin streaming audio from the configured device."""
+        """Begin capturing audio, reusing the open stream when the device is unchanged."""
         with self._lock:
-            if self._stream:
+            if self._stream is not None and self._stream.active:
                 logger.warning("AudioRecorder.start called while already running.")
                 return
-            self._buffer.clear()
-            self._frames_recorded = 0
-
-            device_index = resolve_device(self._config.mic_device_name)
-            blocksize = max(int(self._config.sample_rate * self._block_duration_ms / 1000), 80)
-            logger.info(
-                "Starting audio stream device={} index={} sample_rate={} blocksize={}",
-                self._config.mic_device_name or "default",
-                device_index,
-                self._config.sample_rate,
-                blocksize,
-            )
+            self._open_locked()
+            self._write_idx = 0
             try:
-                self._stream = sd.InputStream(
-                    device=device_index,
-                    channels=1,
-                    samplerate=self._config.sample_rate,
-                    blocksize=blocksize,
-                    dtype="int16",
-                    callback=self._callback,
-                )
                 self._stream.start()
             except Exception as exc:  # pragma: no cover - runtime safeguard
                 logger.bind(error=str(exc)).exception("Failed to start audio stream")
-                self._stream = None
+                self._close_locked()
+                invalidate_device_cache()
                 raise
 
     def stop(self) -> None:
-        """Stop streaming and close resources."""
+        """Stop capturing while keeping the stream open for the next session."""
         with self._lock:
-            if not self._stream:
+            if self._stream is None or not self._stream.active:
                 return
-            try:
-                self._stream.stop()
-            finally:
-                self._stream.close()
-                self._stream = None
-            logger.info("Audio stream stopped after %s frames", self._frames_recorded)
+            self._stream.stop()
+            logger.info("Audio stream stopped after %s frames", self._write_idx)
+
+    def close(self) -> None:
+        """Stop capturing and release the audio device."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._stream is None:
+            return
+        try:
+            self._stream.stop()
+        finally:
+            self._stream.close()
+            self._stream = None
+            self._stream_settings = None
 
     def reset(self) -> None:
         """Clear buffered audio without stopping the stream."""
         with self._lock:
-            self._buffer.clear()
-            self._frames_recorded = 0
+            self._write_idx = 0
+
+    def _grow_ring(self, required: int) -> None:
+        """Reallocate the capture buffer so it can hold at least ``required`` samples."""
+        grown = np.empty(max(required, self._ring.size * 2), dtype=np.int16)
+        grown[: self._write_idx] = self._ring[: self._write_idx]
+        self._ring = grown
 
     def _callback(self, indata, frames, time_info, status) -> None:
         if status:
             logger.warning("Audio stream status: %s", status)
-        frame = indata.copy()
-        if self.gain_multiplier != 1.0:
-            frame = np.clip(frame * self.gain_multiplier, -32768, 32767).astype(np.int16)
-        with self._lock:
-            self._buffer.append(frame)
-            self._frames_recorded += frames
+        samples = indata.reshape(-1)
+        start = self._write_idx
+        end = start + samples.size
+        if end > self._ring.size:
+            self._grow_ring(end)
+        frame = self._ring[start:end]
+        frame[:] = samples
+        gain = self.gain_multiplier
+        if gain != 1.0:
+            if self._gain_scratch.size < frame.size:
+                self._gain_scratch = np.empty(frame.size, dtype=np.float32)
+            _apply_gain(frame, gain, self._gain_scratch)
+        self._write_idx = end
         if self._level_callback:
-            level = self._smoother.push(rms_level(frame.tobytes()))
+            level = self._smoother.push(rms_level(frame))
             self._level_callback(level)
-        if self._waveform_callback:
-            waveform = frame.astype(np.float32).reshape(-1) / 32768.0
-            self._waveform_callback(waveform, self._config.sample_rate)
+        if self._waveform_callback and self._config.overlay_enabled:
+            # Hand consumers the raw int16 view; scaling to float is left to whoever renders it.
+            self._waveform_callback(frame, self._config.sample_rate)
 
-    def get_wav_bytes(self) -> bytes:
-        """Return the captured audio as a WAV byte sequence."""
+    def get_wav_bytes(self) -> memoryview:
+        """Return the captured audio as a WAV payload, viewed without copying the backing buffer."""
         with self._lock:
-            if not self._buffer:
-                return b""
-            data = np.concatenate(self._buffer)
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(self._config.sample_rate)
-            wav_file.writeframes(data.tobytes())
-        payload = wav_buffer.getvalue()
+            if not self._write_idx:
+                return memoryview(b"")
+            data = self._ring[: self._write_idx]
+        header_size = _WAV_HEADER.size
+        payload = bytearray(header_size + data.nbytes)
+        payload[:header_size] = _build_wav_header(self._config.sample_rate, data.size)
+        payload[header_size:] = memoryview(data).cast("B")
         if self._keep_last_path:
             try:
                 with open(self._keep_last_path, "wb") as fh:
                     fh.write(payload)
             except OSError:
                 logger.exception("Unable to write debug audio to %s", self._keep_last_path)
-        return payload
+        return memoryview(payload)
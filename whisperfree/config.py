@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-from dotenv import load_dotenv
+from typing import Any, Dict, Optional, Tuple
 
 
 CONFIG_DIR = Path.home() / ".whisperfree"
@@ -20,7 +18,7 @@ def _ensure_config_dir() -> None:
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Represents persisted WhisperFree configuration."""
 
@@ -39,16 +37,12 @@ class AppConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to a JSON serialisable dictionary."""
-        return asdict(self)
+        return {name: getattr(self, name) for name in _FIELDS}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AppConfig":
         """Instantiate from persisted dictionary, ignoring unknown keys."""
-        kwargs: Dict[str, Any] = {}
-        for field_name in cls.__dataclass_fields__:  # type: ignore[attr-defined]
-            if field_name in data:
-                kwargs[field_name] = data[field_name]
-        return cls(**kwargs)
+        return cls(**{name: data[name] for name in _FIELDS if name in data})
 
     def save(self, path: Path = CONFIG_PATH) -> None:
         """Persist configuration to disk."""
@@ -56,11 +50,14 @@ class AppConfig:
         path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
 
     def resolve_api_key(self) -> Optional[str]:
-        """Return the OpenAI API key using env var + .env convenience loading."""
-        load_dotenv()
+        """Return the OpenAI API key from the environment (``.env`` is loaded once at startup)."""
         return os.environ.get(self.api_key_env)
 
 
+# All fields are flat scalars, so a precomputed name tuple replaces the recursive asdict()/fields() walk.
+_FIELDS: Tuple[str, ...] = tuple(field.name for field in fields(AppConfig))
+
+
 def load_config(path: Path = CONFIG_PATH) -> AppConfig:
     """Load configuration from disk, falling back to defaults on error."""
     if not path.exists():
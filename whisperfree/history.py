@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+import atexit
 import json
 import re
+import sqlite3
 import threading
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, NamedTuple, Optional
+
+import numpy as np
 
 from whisperfree.config import CONFIG_DIR
 from whisperfree.utils.logger import get_logger
@@ -17,23 +20,58 @@ from whisperfree.utils.logger import get_logger
 logger = get_logger(__name__)
 
 _WORD_PATTERN = re.compile(r"\b\w+\b", re.UNICODE)
-HISTORY_PATH = CONFIG_DIR / "history.jsonl"
-
-
-def _ensure_history_dir() -> None:
-    """Make sure the history directory exists."""
-    HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+# ASCII byte classes matching `\w`, used to count word runs without the regex engine.
+_WORD_LUT = np.zeros(256, dtype=np.int8)
+_WORD_LUT[ord("0") : ord("9") + 1] = 1
+_WORD_LUT[ord("A") : ord("Z") + 1] = 1
+_WORD_LUT[ord("a") : ord("z") + 1] = 1
+_WORD_LUT[ord("_")] = 1
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+HISTORY_PATH = CONFIG_DIR / "history.sqlite3"
+LEGACY_HISTORY_PATH = CONFIG_DIR / "history.jsonl"
+
+# Timestamps are stored as integer microseconds since the Unix epoch (UTC) so the index orders them correctly.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    ts INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    words INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_ts ON entries (ts DESC);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    words INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, words) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_total_words AFTER INSERT ON entries
+BEGIN
+    UPDATE totals SET words = words + NEW.words WHERE id = 0;
+END;
+"""
 
 
 def _word_count(text: str) -> int:
-    """Count words in text using a regex-based tokeniser."""
+    """Count words in text, using a byte lookup table for ASCII and the regex tokeniser otherwise."""
     if not text:
         return 0
-    return len(_WORD_PATTERN.findall(text))
+    if not text.isascii():
+        return len(_WORD_PATTERN.findall(text))
+    is_word = _WORD_LUT[np.frombuffer(text.encode("ascii"), dtype=np.uint8)]
+    return int(is_word[0]) + int(np.count_nonzero(is_word[1:] > is_word[:-1]))
+
+
+def _to_micros(timestamp: datetime) -> int:
+    """Convert an aware datetime into integer microseconds since the epoch."""
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    """Convert integer microseconds since the epoch into an aware UTC datetime."""
+    return _EPOCH + timedelta(microseconds=value)
 
 
-@dataclass(frozen=True)
-class TranscriptionEntry:
+class TranscriptionEntry(NamedTuple):
     """Represents a single transcription event."""
 
     timestamp: datetime
@@ -63,80 +101,96 @@ class TranscriptionEntry:
 
 
 class TranscriptionHistory:
-    """Persist transcription events to disk and expose statistics."""
+    """Persist transcription events to SQLite and expose statistics."""
 
-    def __init__(self, path: Path = HISTORY_PATH) -> None:
+    def __init__(self, path: Path = HISTORY_PATH, legacy_path: Path = LEGACY_HISTORY_PATH) -> None:
         self._path = path
+        self._legacy_path = legacy_path
         self._lock = threading.Lock()
-        self._total_words: Optional[int] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        atexit.register(self.close)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use. Callers must hold ``self._lock``."""
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            # WAL + NORMAL keeps commits off the fsync path; the log is synced at checkpoints and on close.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._migrate_legacy(conn)
+        return self._conn
+
+    def close(self) -> None:
+        """Checkpoint and close the database connection if it is open."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.close()
+            except sqlite3.Error as exc:  # pragma: no cover - defensive
+                logger.warning("Failed to close history database: %s", exc)
+            self._conn = None
+
+    def _migrate_legacy(self, conn: sqlite3.Connection) -> None:
+        """Import the JSONL history written by earlier releases, then retire the file."""
+        if not self._legacy_path.exists() or conn.execute("SELECT 1 FROM entries LIMIT 1").fetchone():
+            return
+        rows = []
+        try:
+            with self._legacy_path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+                        logger.warning("Skipping corrupt history line: %s (error=%s)", line, exc)
+                        continue
+                    entry = TranscriptionEntry.from_dict(data)
+                    if entry:
+                        rows.append((_to_micros(entry.timestamp), entry.text, entry.words))
+            with conn:
+                conn.executemany("INSERT INTO entries (ts, text, words) VALUES (?, ?, ?)", rows)
+            self._legacy_path.replace(self._legacy_path.with_name(self._legacy_path.name + ".migrated"))
+        except (OSError, sqlite3.Error) as exc:  # pragma: no cover - defensive
+            logger.warning("Unable to migrate legacy history file %s: %s", self._legacy_path, exc)
+            return
+        logger.info("Migrated {} history entries from {}", len(rows), self._legacy_path)
 
     def add_entry(self, text: str, timestamp: Optional[datetime] = None) -> TranscriptionEntry:
-        """Append a transcription event to the history log."""
+        """Append a transcription event to the history store."""
         ts = timestamp or datetime.now(timezone.utc)
+        if ts.tzinfo is None:
+            # Treat naive timestamps as UTC, matching how legacy JSON entries are read.
+            ts = ts.replace(tzinfo=timezone.utc)
         entry = TranscriptionEntry(timestamp=ts, text=text, words=_word_count(text))
-        payload = json.dumps(entry.to_dict(), ensure_ascii=False)
         with self._lock:
-            _ensure_history_dir()
-            with self._path.open("a", encoding="utf-8") as handle:
-                handle.write(payload + "\n")
-            self._total_words = (self._total_words or 0) + entry.words
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT INTO entries (ts, text, words) VALUES (?, ?, ?)",
+                    (_to_micros(entry.timestamp), entry.text, entry.words),
+                )
         return entry
 
     def entries(self, limit: Optional[int] = None) -> List[TranscriptionEntry]:
         """Return history entries in reverse chronological order."""
-        records: List[TranscriptionEntry] = []
-        total_words = 0
-        if not self._path.exists():
-            return records
         with self._lock:
-            raw_lines = self._path.read_text(encoding="utf-8").splitlines()
-        for line in reversed(raw_lines):
-            if not line.strip():
-                continue
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError as exc:  # pragma: no cover - defensive
-                logger.warning("Skipping corrupt history line: %s (error=%s)", line, exc)
-                continue
-            entry = TranscriptionEntry.from_dict(data)
-            if entry:
-                records.append(entry)
-                total_words += entry.words
-            if limit and len(records) >= limit:
-                break
-        if limit is None:
-            with self._lock:
-                self._total_words = total_words
-        return records
+            rows = self._connection().execute(
+                "SELECT ts, text, words FROM entries ORDER BY ts DESC, rowid DESC LIMIT ?",
+                (limit if limit else -1,),
+            ).fetchall()
+        return [TranscriptionEntry(_from_micros(ts), text, words) for ts, text, words in rows]
 
     def total_word_count(self) -> int:
         """Return the total number of words transcribed."""
         with self._lock:
-            if self._total_words is not None:
-                return self._total_words
-            if not self._path.exists():
-                self._total_words = 0
-                return 0
-            try:
-                raw_lines = self._path.read_text(encoding="utf-8").splitlines()
-            except OSError as exc:  # pragma: no cover - defensive
-                logger.warning("Unable to read history file for totals: %s", exc)
-                self._total_words = 0
-                return 0
-            total = 0
-            for line in raw_lines:
-                if not line.strip():
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError as json_exc:  # pragma: no cover - defensive
-                    logger.warning("Skipping corrupt history line during totals: %s (error=%s)", line, json_exc)
-                    continue
-                entry = TranscriptionEntry.from_dict(data)
-                if entry:
-                    total += entry.words
-            self._total_words = total
-            return total
+            row = self._connection().execute("SELECT words FROM totals WHERE id = 0").fetchone()
+        return int(row[0]) if row else 0
 
     @staticmethod
     def group_by_day(entries: Iterable[TranscriptionEntry]) -> dict[str, List[TranscriptionEntry]]:
@@ -147,4 +201,3 @@ class TranscriptionHistory:
             key = local_time.strftime("%Y-%m-%d")
             grouped.setdefault(key, []).append(entry)
         return grouped
-
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import time
-from typing import Callable, Optional, Set
+from typing import Callable, List
 
 import keyboard
 
@@ -11,9 +11,14 @@ from whisperfree.utils.logger import get_logger
 
 
 Handler = Callable[[], None]
+KeyEventHandler = Callable[[keyboard.KeyboardEvent], None]
 
 logger = get_logger(__name__)
 
+_PRIMARY_BIT = 0b01
+_SECONDARY_BIT = 0b10
+_CHORD_MASK = _PRIMARY_BIT | _SECONDARY_BIT
+
 
 def _normalise_key(name: str) -> str:
     """Normalise key names so comparisons stay consistent."""
@@ -44,57 +49,79 @@ class HotkeyListener:
     ) -> None:
         self._on_start = on_start
         self._on_stop = on_stop
-        self._required_keys = {_normalise_key(primary), _normalise_key(secondary)}
+        self._primary_key = _normalise_key(primary)
+        self._secondary_key = _normalise_key(secondary)
         self._debounce = debounce_ms / 1000.0
-        self._pressed: Set[str] = set()
+        self._pressed_mask = 0
         self._active = False
         self._last_event_ts = 0.0
-        self._hook: Optional[Callable] = None
+        self._hooks: List[Callable] = []
+        self._listening = False
 
     def start(self) -> None:
-        """Begin listening for keyboard events."""
-        if self._hook is not None:
+        """Begin listening for keyboard events on the required keys only."""
+        if self._hooks:
             return
-        self._hook = keyboard.hook(self._handle_event, suppress=False)
+        self._listening = True
+        # `keyboard` still sees every event on its listener thread, but filters per-key hooks by scan code before
+        # calling back, so unrelated keystrokes skip our handler and its name normalisation.
+        for key, bit in ((self._primary_key, _PRIMARY_BIT), (self._secondary_key, _SECONDARY_BIT)):
+            try:
+                self._hooks.append(keyboard.hook_key(key, self._make_key_handler(bit), suppress=False))
+            except ValueError as exc:
+                logger.error("Cannot register hotkey for unknown key name {!r}: {}", key, exc)
+                self._unhook_all()
+                return
+
+    def _unhook_all(self) -> None:
+        for hook in self._hooks:
+            try:
+                keyboard.unhook_key(hook)
+            except (KeyError, ValueError):  # pragma: no cover - already removed
+                pass
+        self._hooks = []
 
     def stop(self) -> None:
         """Stop listening for keyboard events."""
-        if self._hook is not None:
-            keyboard.unhook(self._hook)
-            self._hook = None
-        self._pressed.clear()
+        self._unhook_all()
+        self._listening = False
+        self._pressed_mask = 0
         self._active = False
 
     def update_hotkey(self, primary: str, secondary: str) -> None:
         """Change the required key combination on the fly."""
-        self._required_keys = {_normalise_key(primary), _normalise_key(secondary)}
-        self._pressed.clear()
-        self._active = False
+        # Track intent rather than installed hooks, so fixing a bad key name re-arms the listener.
+        was_listening = self._listening
+        self.stop()
+        self._primary_key = _normalise_key(primary)
+        self._secondary_key = _normalise_key(secondary)
+        if was_listening:
+            self.start()
 
-    def _handle_event(self, event: keyboard.KeyboardEvent) -> None:
-        if event.event_type not in ("down", "up"):
-            return
-        key = _normalise_key(event.name or "")
-        if not key:
-            return
+    def _make_key_handler(self, bit: int) -> KeyEventHandler:
+        def _handler(event: keyboard.KeyboardEvent) -> None:
+            self._handle_event(bit, event)
+
+        return _handler
 
+    def _handle_event(self, bit: int, event: keyboard.KeyboardEvent) -> None:
         if event.event_type == "down":
-            if key not in self._required_keys:
+            if self._pressed_mask & bit:
+                # Auto-repeat while the key is held; nothing changes until it is released.
                 return
-            self._pressed.add(key)
-            logger.debug("Hotkey press raw=%s normalised=%s pressed=%s", event.name, key, sorted(self._pressed))
-            if self._required_keys.issubset(self._pressed) and not self._active:
+            self._pressed_mask |= bit
+            logger.debug("Hotkey press raw=%s mask=%s", event.name, self._pressed_mask)
+            if self._pressed_mask == _CHORD_MASK and not self._active:
                 now = time.monotonic()
                 if (now - self._last_event_ts) < self._debounce:
                     return
                 self._last_event_ts = now
                 self._active = True
                 self._safe_call(self._on_start)
-        else:  # event_type == "up"
-            if key in self._pressed:
-                self._pressed.remove(key)
-            logger.debug("Hotkey release raw=%s normalised=%s pressed=%s", event.name, key, sorted(self._pressed))
-            if self._active and not self._required_keys.issubset(self._pressed):
+        elif event.event_type == "up":
+            self._pressed_mask &= ~bit
+            logger.debug("Hotkey release raw=%s mask=%s", event.name, self._pressed_mask)
+            if self._active and self._pressed_mask != _CHORD_MASK:
                 self._last_event_ts = time.monotonic()
                 self._active = False
                 self._safe_call(self._on_stop)
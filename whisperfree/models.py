@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import List, Tuple
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping, Optional, Tuple
 
 
 LANGUAGE_CHOICES: List[Tuple[str, str]] = [
@@ -17,3 +18,11 @@ LANGUAGE_CHOICES: List[Tuple[str, str]] = [
     ("pt", "Portuguese"),
     ("zh", "Chinese"),
 ]
+
+LANGUAGE_LABELS: Mapping[str, str] = MappingProxyType(dict(LANGUAGE_CHOICES))
+SUPPORTED_LANGUAGE_CODES: FrozenSet[str] = frozenset(LANGUAGE_LABELS)
+
+
+def is_auto_language(language: Optional[str]) -> bool:
+    """Return True when the language setting means "let the model detect it"."""
+    return not language or language.lower() == "auto"
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import time
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
@@ -16,6 +16,8 @@ class OverlayWindow(QtWidgets.QWidget):
     BASELINE_OFFSET = 24
     SCREEN_MARGIN = 28
     FIXED_WIDTH = 360
+    ELAPSED_SLACK_MS = 20
+    PILL_PATH_CACHE_SIZE = 64
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
@@ -25,25 +27,38 @@ class OverlayWindow(QtWidgets.QWidget):
             | QtCore.Qt.WindowType.Tool
         )
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground)
+        # Everything outside the pill is transparent, so skip the system background fill on repaint.
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_NoSystemBackground)
         self.setMouseTracking(True)
 
         self.setFixedHeight(int(self.EXPANDED_HEIGHT + self.BASELINE_OFFSET))
         self.setFixedWidth(self.FIXED_WIDTH)
 
         self._visual_height = self.COLLAPSED_HEIGHT
-        self._height_animation = QtCore.QPropertyAnimation(self, b"visualHeight", self)
+        self._painted_height = self.COLLAPSED_HEIGHT
+        self._pill_paths: Dict[Tuple[int, int, int], QtGui.QPainterPath] = {}
+        # Drive the height from valueChanged directly rather than animating a pyqtProperty through Qt's meta-object system.
+        self._height_animation = QtCore.QVariantAnimation(self)
         self._height_animation.setDuration(220)
         self._height_animation.setEasingCurve(QtCore.QEasingCurve.Type.OutCubic)
+        self._height_animation.valueChanged.connect(self.setVisualHeight)
         self._height_timer: Optional[QtCore.QTimer] = None
 
         self._state = "idle"
         self._expanded = False
         self._recording_start: Optional[float] = None
         self._elapsed_text = "00:00"
+        self._elapsed_seconds = 0
 
+        # The MM:SS readout changes once per second of recording, so tick at 1 Hz from just after each boundary.
         self._elapsed_timer = QtCore.QTimer(self)
-        self._elapsed_timer.setInterval(500)
+        self._elapsed_timer.setInterval(1000)
+        self._elapsed_timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
         self._elapsed_timer.timeout.connect(self._update_elapsed)
+        self._elapsed_bootstrap = QtCore.QTimer(self)
+        self._elapsed_bootstrap.setSingleShot(True)
+        self._elapsed_bootstrap.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._elapsed_bootstrap.timeout.connect(self._bootstrap_elapsed)
 
         self._toast_label = QtWidgets.QLabel("", self)
         self._toast_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
@@ -56,6 +71,27 @@ class OverlayWindow(QtWidgets.QWidget):
         self._toast_timer.setSingleShot(True)
         self._toast_timer.timeout.connect(self._toast_label.hide)
 
+        self._timer_font = QtGui.QFont()
+        self._timer_font.setPointSizeF(11.0)
+        self._timer_font.setBold(True)
+        self._status_font = QtGui.QFont()
+        self._status_font.setPointSizeF(14.0)
+        self._status_font.setBold(True)
+        self._col_idle = QtGui.QColor("#C9CCD1")
+        self._col_rec = QtGui.QColor("#FF453A")
+        self._col_mute = QtGui.QColor("#80838A")
+        self._col_pill = QtGui.QColor(0, 0, 0, 220)
+        self._col_white = QtGui.QColor("#FFFFFF")
+        self._col_inner_idle = QtGui.QColor("#3A3A3C")
+        self._pen_white = QtGui.QPen(self._col_white, 2)
+
+        # Screen geometry rarely changes, so placement is computed once and refreshed only on screen signals.
+        self._cached_placement: Optional[Tuple[int, int, int]] = None
+        self._watched_screen: Optional[QtGui.QScreen] = None
+        app = QtGui.QGuiApplication.instance()
+        if app is not None:
+            app.primaryScreenChanged.connect(self._invalidate_placement)
+
         self._update_dimensions()
 
     # ------------------------------------------------------------------ Qt events
@@ -79,6 +115,8 @@ class OverlayWindow(QtWidgets.QWidget):
         self._state = "idle"
         self._recording_start = None
         self._elapsed_text = "00:00"
+        self._elapsed_seconds = 0
+        self._elapsed_bootstrap.stop()
         self._elapsed_timer.stop()
         self._set_expanded(False)
         self._height_animation.stop()
@@ -90,13 +128,16 @@ class OverlayWindow(QtWidgets.QWidget):
     def show_recording(self) -> None:
         self._state = "recording"
         self._recording_start = time.monotonic()
-        self._elapsed_timer.start()
+        self._elapsed_timer.stop()
+        self._elapsed_bootstrap.start(1000 + self.ELAPSED_SLACK_MS)
         self._update_elapsed()
+        self.update()
         self._update_dimensions()
         self.show()
 
     def hide_overlay(self) -> None:
         self._state = "hidden"
+        self._elapsed_bootstrap.stop()
         self._elapsed_timer.stop()
         self.hide()
 
@@ -144,6 +185,7 @@ class OverlayWindow(QtWidgets.QWidget):
         _ = event
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
 
         pill_rect = QtCore.QRectF(
             0.0,
@@ -153,40 +195,46 @@ class OverlayWindow(QtWidgets.QWidget):
         )
 
         if self._visual_height <= self.COLLAPSED_HEIGHT + 0.5:
-            color = QtGui.QColor("#C9CCD1") if self._state != "recording" else QtGui.QColor("#FF453A")
+            color = self._col_idle if self._state != "recording" else self._col_rec
             line_height = max(2.0, self._visual_height)
             top_offset = (pill_rect.height() - line_height) / 2.0
             line_rect = pill_rect.adjusted(20.0, top_offset, -20.0, -top_offset)
-            painter.setPen(QtCore.Qt.PenStyle.NoPen)
             painter.setBrush(color)
             painter.drawRoundedRect(line_rect, line_height / 2.0, line_height / 2.0)
             return
 
         if self._visual_height < self.EXPANDED_HEIGHT - 0.5:
             # Render just the pill during the animation, defer content until expanded.
-            painter.setPen(QtCore.Qt.PenStyle.NoPen)
-            painter.setBrush(QtGui.QColor(0, 0, 0, 220))
-            painter.drawRoundedRect(pill_rect, pill_rect.height() / 2.0, pill_rect.height() / 2.0)
+            painter.fillPath(self._pill_path(pill_rect), self._col_pill)
             return
 
-        painter.setPen(QtCore.Qt.PenStyle.NoPen)
-        painter.setBrush(QtGui.QColor(0, 0, 0, 220))
-        painter.drawRoundedRect(pill_rect, pill_rect.height() / 2.0, pill_rect.height() / 2.0)
-
+        recording = self._state == "recording"
         content_rect = pill_rect.adjusted(24.0, 0.0, -24.0, 0.0)
         centre_y = pill_rect.center().y()
 
         indicator_radius = 5.5
-        indicator_color = QtGui.QColor("#FF453A") if self._state == "recording" else QtGui.QColor("#80838A")
+        indicator_color = self._col_rec if recording else self._col_mute
         indicator_center = QtCore.QPointF(content_rect.left() + indicator_radius, centre_y)
+
+        button_radius = min(20.0, pill_rect.height() / 2.5)
+        button_center = QtCore.QPointF(pill_rect.right() - 32.0, centre_y)
+        outer_rect = QtCore.QRectF(
+            button_center.x() - button_radius,
+            button_center.y() - button_radius,
+            button_radius * 2,
+            button_radius * 2,
+        )
+        inner_padding = button_radius * 0.55
+        inner_rect = outer_rect.adjusted(inner_padding, inner_padding, -inner_padding, -inner_padding)
+
+        # Group draws by painter state: pen-less fills first, then text, then the single stroked outline.
+        painter.fillPath(self._pill_path(pill_rect), self._col_pill)
         painter.setBrush(indicator_color)
-        painter.setPen(QtCore.Qt.PenStyle.NoPen)
         painter.drawEllipse(indicator_center, indicator_radius, indicator_radius)
+        painter.setBrush(self._col_rec if recording else self._col_inner_idle)
+        painter.drawRoundedRect(inner_rect, 4.0, 4.0)
 
-        timer_font = QtGui.QFont()
-        timer_font.setPointSizeF(11.0)
-        timer_font.setBold(True)
-        painter.setFont(timer_font)
+        painter.setFont(self._timer_font)
         painter.setPen(indicator_color)
         timer_height = 18.0
         timer_rect = QtCore.QRectF(
@@ -195,15 +243,12 @@ class OverlayWindow(QtWidgets.QWidget):
             70.0,
             timer_height,
         )
-        timer_text = self._elapsed_text if self._state == "recording" else "00:00"
+        timer_text = self._elapsed_text if recording else "00:00"
         painter.drawText(timer_rect, QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter, timer_text)
 
-        status_font = QtGui.QFont()
-        status_font.setPointSizeF(14.0)
-        status_font.setBold(True)
-        painter.setFont(status_font)
-        painter.setPen(QtGui.QColor("#FFFFFF"))
-        status_text = "Recording" if self._state == "recording" else "Ctrl+Win to Record"
+        painter.setFont(self._status_font)
+        painter.setPen(self._col_white)
+        status_text = "Recording" if recording else "Ctrl+Win to Record"
         status_height = 24.0
         status_rect = QtCore.QRectF(
             timer_rect.right() + 12.0,
@@ -213,38 +258,56 @@ class OverlayWindow(QtWidgets.QWidget):
         )
         painter.drawText(status_rect, QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter, status_text)
 
-        button_radius = min(20.0, pill_rect.height() / 2.5)
-        button_center = QtCore.QPointF(pill_rect.right() - 32.0, pill_rect.center().y())
-        outer_rect = QtCore.QRectF(
-            button_center.x() - button_radius,
-            button_center.y() - button_radius,
-            button_radius * 2,
-            button_radius * 2,
-        )
         painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
-        painter.setPen(QtGui.QPen(QtGui.QColor("#FFFFFF"), 2))
+        painter.setPen(self._pen_white)
         painter.drawEllipse(outer_rect)
 
-        inner_padding = button_radius * 0.55
-        inner_rect = outer_rect.adjusted(inner_padding, inner_padding, -inner_padding, -inner_padding)
-        painter.setBrush(QtGui.QColor("#FF453A") if self._state == "recording" else QtGui.QColor("#3A3A3C"))
-        painter.setPen(QtCore.Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(inner_rect, 4.0, 4.0)
-
     # ------------------------------------------------------------------ helpers
 
+    def _pill_path(self, rect: QtCore.QRectF) -> QtGui.QPainterPath:
+        # Heights are bucketed to quarter pixels so the animation reuses a small set of outlines.
+        key = (self.width(), self.height(), int(self._visual_height * 4))
+        path = self._pill_paths.get(key)
+        if path is None:
+            if len(self._pill_paths) >= self.PILL_PATH_CACHE_SIZE:
+                self._pill_paths.clear()
+            path = QtGui.QPainterPath()
+            path.addRoundedRect(rect, rect.height() / 2.0, rect.height() / 2.0)
+            self._pill_paths[key] = path
+        return path
+
     def _update_dimensions(self) -> None:
-        screen = QtGui.QGuiApplication.primaryScreen()
-        if not screen:
-            return
-        geometry = screen.availableGeometry()
-        width = min(self.FIXED_WIDTH, int(geometry.width() * 0.6))
+        if self._cached_placement is None:
+            screen = QtGui.QGuiApplication.primaryScreen()
+            if not screen:
+                return
+            self._watch_screen(screen)
+            geometry = screen.availableGeometry()
+            width = min(self.FIXED_WIDTH, int(geometry.width() * 0.6))
+            x = geometry.center().x() - width // 2
+            y = geometry.bottom() - self.SCREEN_MARGIN - (self.height() - self.BASELINE_OFFSET)
+            self._cached_placement = (x, y, width)
+        x, y, width = self._cached_placement
         if width != self.width():
             self.setFixedWidth(width)
-        x = geometry.center().x() - self.width() // 2
-        y = geometry.bottom() - self.SCREEN_MARGIN - (self.height() - self.BASELINE_OFFSET)
         self.move(x, y)
 
+    def _watch_screen(self, screen: QtGui.QScreen) -> None:
+        if screen is self._watched_screen:
+            return
+        if self._watched_screen is not None:
+            try:
+                self._watched_screen.availableGeometryChanged.disconnect(self._invalidate_placement)
+            except (TypeError, RuntimeError):  # pragma: no cover - screen already gone
+                pass
+        screen.availableGeometryChanged.connect(self._invalidate_placement)
+        self._watched_screen = screen
+
+    def _invalidate_placement(self, *_: object) -> None:
+        self._cached_placement = None
+        if self.isVisible():
+            self._update_dimensions()
+
     def _position_toast(self) -> None:
         if not self._toast_label.isHidden():
             self._toast_label.move(
@@ -255,30 +318,44 @@ class OverlayWindow(QtWidgets.QWidget):
                 ),
             )
 
+    def _bootstrap_elapsed(self) -> None:
+        self._update_elapsed()
+        self._elapsed_timer.start()
+
     def _update_elapsed(self) -> None:
         if self._recording_start is None:
             self._elapsed_text = "00:00"
+            self._elapsed_seconds = 0
+            return
+        total = int(max(0.0, time.monotonic() - self._recording_start))
+        if total == self._elapsed_seconds:
             return
-        elapsed = max(0.0, time.monotonic() - self._recording_start)
-        minutes = int(elapsed // 60)
-        seconds = int(elapsed % 60)
+        self._elapsed_seconds = total
+        minutes, seconds = divmod(total, 60)
         self._elapsed_text = f"{minutes:02d}:{seconds:02d}"
         self.update()
 
-    # ------------------------------------------------------------------ Qt property
+    # ------------------------------------------------------------------ visual height
 
     def getVisualHeight(self) -> float:
         return self._visual_height
 
     def setVisualHeight(self, value: float) -> None:
         clamped = max(self.COLLAPSED_HEIGHT, min(self.EXPANDED_HEIGHT, float(value)))
-        if abs(self._visual_height - clamped) > 0.25:
-            self._visual_height = clamped
-            self._position_toast()
-            self.update()
-        else:
-            self._visual_height = clamped
-            self._position_toast()
-            self.update()
-
-    visualHeight = QtCore.pyqtProperty(float, fget=getVisualHeight, fset=setVisualHeight)
+        self._visual_height = clamped
+        # Skip repaints for moves smaller than a quarter device pixel, but always land exactly on the end stops.
+        threshold = 0.25 / max(1.0, self.devicePixelRatioF())
+        at_rest = clamped in (self.COLLAPSED_HEIGHT, self.EXPANDED_HEIGHT)
+        delta = abs(clamped - self._painted_height)
+        if delta == 0.0 or (delta < threshold and not at_rest):
+            return
+        previous = self._painted_height
+        self._painted_height = clamped
+        self._position_toast()
+        # Only the band swept by the pill between the two heights needs recompositing.
+        self.update(self._pill_band(max(previous, clamped)))
+
+    def _pill_band(self, height: float) -> QtCore.QRect:
+        bottom = self.height() - self.BASELINE_OFFSET
+        top = int(bottom - height) - 1
+        return QtCore.QRect(0, top, self.width(), bottom - top + 1)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import sys
 import threading
 import time
-from typing import Optional
+from typing import Callable, Optional
 
 import keyboard
 import pyperclip
@@ -14,6 +15,127 @@ from whisperfree.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_restore_lock = threading.Lock()
+_pending_restore: Optional["_PendingRestore"] = None
+
+
+class _PendingRestore:
+    """Put the user's clipboard back after a delay, unless a newer paste supersedes it first."""
+
+    def __init__(self, value: str, delay: float) -> None:
+        self.value = value
+        # Delay restoration so the target app finishes reading the clipboard before we revert.
+        self._timer = threading.Timer(delay, self._fire)
+
+    def start(self) -> None:
+        self._timer.start()
+
+    def cancel(self) -> None:
+        self._timer.cancel()
+
+    def _fire(self) -> None:
+        global _pending_restore
+        with _restore_lock:
+            if _pending_restore is not self:
+                return
+            _pending_restore = None
+            try:
+                pyperclip.copy(self.value)
+            except pyperclip.PyperclipException:
+                logger.warning("Failed to restore original clipboard contents.")
+
+
+def _take_pending_restore() -> Optional[str]:
+    """Cancel any scheduled restore and return the clipboard value it would have put back."""
+    global _pending_restore
+    with _restore_lock:
+        pending, _pending_restore = _pending_restore, None
+    if pending is None:
+        return None
+    pending.cancel()
+    return pending.value
+
+
+def _schedule_restore(value: str, delay: float) -> None:
+    global _pending_restore
+    pending = _PendingRestore(value, delay)
+    with _restore_lock:
+        _pending_restore = pending
+    pending.start()
+
+
+_win32_send_paste: Optional[Callable[[], bool]] = None
+
+
+def _build_win32_send_paste() -> Callable[[], bool]:
+    """Prepare a SendInput batch of Ctrl down, V down, V up, Ctrl up."""
+    import ctypes
+    from ctypes import wintypes
+
+    input_keyboard = 1
+    keyeventf_keyup = 0x0002
+    vk_control = 0x11
+    vk_v = 0x56
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _InputUnion(ctypes.Union):
+        # MOUSEINPUT is the largest member, so it fixes the union (and INPUT) at the size SendInput expects.
+        _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("union", _InputUnion)]
+
+    def _key(vk: int, flags: int = 0) -> INPUT:
+        return INPUT(type=input_keyboard, union=_InputUnion(ki=KEYBDINPUT(wVk=vk, dwFlags=flags)))
+
+    batch = (INPUT * 4)(
+        _key(vk_control),
+        _key(vk_v),
+        _key(vk_v, keyeventf_keyup),
+        _key(vk_control, keyeventf_keyup),
+    )
+    send_input = ctypes.windll.user32.SendInput
+    send_input.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+    send_input.restype = wintypes.UINT
+
+    def _send() -> bool:
+        return send_input(len(batch), batch, ctypes.sizeof(INPUT)) == len(batch)
+
+    return _send
+
+
+def _send_paste_keystroke() -> None:
+    """Press Ctrl+V, using one Win32 SendInput call where available."""
+    global _win32_send_paste
+    if sys.platform == "win32":
+        try:
+            if _win32_send_paste is None:
+                _win32_send_paste = _build_win32_send_paste()
+            if _win32_send_paste():
+                return
+            logger.warning("SendInput injected only part of the paste chord; falling back to keyboard.send.")
+        except Exception as exc:  # pragma: no cover - platform-specific failure
+            logger.bind(error=str(exc)).warning("SendInput paste failed; falling back to keyboard.send.")
+    keyboard.send("ctrl+v")
+
 
 def paste_text(
     text: str,
@@ -27,21 +149,32 @@ def paste_text(
     sanitised = text.rstrip("\r\n")
     payload = sanitised + ("\n" if append_newline else "")
     original: Optional[str] = None
+    # A restore still waiting from the previous paste would clobber this one; its value is the real original.
+    superseded = _take_pending_restore()
 
     try:
         if restore_clipboard:
-            try:
-                original = pyperclip.paste()
-            except pyperclip.PyperclipException:
-                logger.warning("Could not read clipboard to save state.")
-        pyperclip.copy(payload)
+            if superseded is not None:
+                original = superseded
+            else:
+                try:
+                    original = pyperclip.paste()
+                except pyperclip.PyperclipException:
+                    logger.warning("Could not read clipboard to save state.")
+        if superseded is None and original == payload:
+            # Already on the clipboard: skip the copy, and there is nothing to restore afterwards.
+            original = None
+        else:
+            pyperclip.copy(payload)
     except pyperclip.PyperclipException as exc:
         logger.bind(error=str(exc)).error("Clipboard copy failed.")
+        if superseded is not None:
+            _schedule_restore(superseded, restore_delay)
         return False
 
     for attempt in range(retries + 1):
         try:
-            keyboard.send("ctrl+v")
+            _send_paste_keystroke()
             logger.info("Paste attempt %s successful", attempt + 1)
             break
         except Exception as exc:  # pragma: no cover - system-level failure
@@ -51,15 +184,6 @@ def paste_text(
             time.sleep(retry_delay)
 
     if restore_clipboard and original is not None:
-        # Delay restoration so the target app finishes reading the clipboard before we revert.
-        def _restore_clipboard(value: str) -> None:
-            try:
-                pyperclip.copy(value)
-            except pyperclip.PyperclipException:
-                logger.warning("Failed to restore original clipboard contents.")
-
-        timer = threading.Timer(restore_delay, _restore_clipboard, args=(original,))
-        timer.daemon = True
-        timer.start()
+        _schedule_restore(original, restore_delay)
 
     return True
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
 from typing import Optional
 
-from openai import OpenAI
-
 from whisperfree.config import AppConfig
+from whisperfree.models import is_auto_language
 from whisperfree.utils.logger import get_logger
 
 
@@ -26,16 +26,31 @@ class ApiTranscriber:
     """Transcribe using the OpenAI Whisper API."""
 
     def __init__(self, api_key: str, model_name: str = "whisper-1") -> None:
+        # Deferred so startup does not load the SDK (httpx, pydantic) until the first transcription.
+        from openai import OpenAI
+
         self._client = OpenAI(api_key=api_key)
         self._model_name = model_name
+        self._params_language: Optional[str] = None
+        self._base_params: dict = {}
+
+    def _params_for(self, language: str) -> dict:
+        """Return the request parameters for a language, rebuilt only when the language setting changes."""
+        if language != self._params_language or not self._base_params:
+            params = {"model": self._model_name}
+            if not is_auto_language(language):
+                params["language"] = language
+            self._base_params = params
+            self._params_language = language
+        return self._base_params
 
     def transcribe(self, audio_bytes: bytes, language: str = "auto") -> TranscriptionResult:
         if not audio_bytes:
             return TranscriptionResult(text="", language=language)
-        file_tuple = ("audio.wav", audio_bytes, "audio/wav")
-        params = {"model": self._model_name, "file": file_tuple}
-        if language and language.lower() != "auto":
-            params["language"] = language
+        # A file object lets httpx stream the multipart body in chunks instead of building it in memory.
+        # BytesIO shares the buffer of a `bytes` payload; views are copied into it exactly once.
+        file_tuple = ("audio.wav", io.BytesIO(audio_bytes), "audio/wav")
+        params = {**self._params_for(language), "file": file_tuple}
         logger.info("Invoking OpenAI Whisper API model=%s", self._model_name)
         response = self._client.audio.transcriptions.create(**params)
         detected_language = getattr(response, "language", language)
@@ -71,6 +86,6 @@ class TranscriptionRouter:
         return self._api_client
 
     def transcribe(self, audio_bytes: bytes) -> TranscriptionResult:
-        """Transcribe audio using the OpenAI Whisper API."""
+        """Transcribe audio using the OpenAI Whisper API, blocking until the response arrives."""
         return self._get_api().transcribe(audio_bytes, language=self._config.language)
 
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import getpass
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional, Sequence
+from typing import Callable, Dict, Iterable, Optional, Sequence
 
 from PyQt6 import QtCore, QtGui, QtWidgets
-from openai import OpenAIError
 
 from whisperfree import models
 from whisperfree.audio import list_microphones
@@ -18,53 +25,172 @@ from whisperfree.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-_ENV_FILE_PATH = Path(__file__).resolve().parent.parent / ".env"
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_ENV_FILE_PATH = _PROJECT_ROOT / ".env"
+_ASSET_DIR = _PROJECT_ROOT / "assets"
+_API_KEY_CACHE_TTL = 300.0
+_API_KEY_CACHE_SIZE = 16
+# SHA-256 of recently verified API keys -> monotonic time of the successful check. Raw keys are never stored.
+_API_KEY_CACHE: Dict[str, float] = {}
+# Compiled `KEY=...` line patterns for .env rewrites, keyed by variable name.
+_ENV_KEY_PATTERNS: Dict[str, "re.Pattern[str]"] = {}
+_ENV_WRITE_LOCK = threading.Lock()
+_ENV_WRITE_POOL: Optional[QtCore.QThreadPool] = None
+
+# Rules for widgets that are created repeatedly, applied once on the control panel and matched by object name.
+_PANEL_STYLESHEET = """
+QPushButton#SidebarButton {
+    border: none;
+    border-radius: 12px;
+    text-align: left;
+    padding: 6px 14px;
+    font-size: 14px;
+    font-weight: 500;
+    color: #4f4669;
+}
+QPushButton#SidebarButton:hover {
+    background-color: #e9e4fb;
+}
+QPushButton#SidebarButton:checked {
+    background-color: #4332d8;
+    color: white;
+}
+QFrame#StatBadge {
+    background-color: white;
+    border-radius: 14px;
+    border: 1px solid #ded9f4;
+}
+QLabel#StatBadgeLabel {
+    color: #6f6591;
+    font-size: 12px;
+}
+QLabel#StatBadgeValue {
+    font-size: 20px;
+    font-weight: 600;
+    color: #2f254d;
+}
+QFrame#HintBanner {
+    background-color: #fef5d8;
+    border-radius: 16px;
+    border: 1px solid #f7d88a;
+}
+QLabel#HintBannerHeadline {
+    font-size: 18px;
+    font-weight: 600;
+    color: #3b2f09;
+}
+QLabel#HintBannerBody {
+    color: #6d5723;
+    font-size: 13px;
+}
+"""
+
+
+class _ApiTestSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(bool, object)
 
 
-class _ApiTestWorker(QtCore.QObject):
-    finished = QtCore.pyqtSignal(bool, object)
+class _ApiTestRunnable(QtCore.QRunnable):
+    """Validate an API key on a pooled thread; results are reported through ``signals``."""
 
     def __init__(self, api_key: str) -> None:
         super().__init__()
         self._api_key = api_key
+        # QRunnable is not a QObject, so a companion object owned by the GUI thread carries the signal.
+        self.signals = _ApiTestSignals()
 
-    @QtCore.pyqtSlot()
     def run(self) -> None:
+        digest = hashlib.sha256(self._api_key.encode("utf-8")).hexdigest()
+        verified_at = _API_KEY_CACHE.get(digest)
+        if verified_at is not None and time.monotonic() - verified_at < _API_KEY_CACHE_TTL:
+            self.signals.finished.emit(True, None)
+            return
         try:
-            from openai import OpenAI
+            # Imported here so opening the control panel does not pay for loading the OpenAI SDK.
+            from openai import OpenAI, OpenAIError
+        except Exception as exc:
+            self.signals.finished.emit(False, exc)
+            return
 
+        try:
             client = OpenAI(api_key=self._api_key)
             client.models.list()
         except OpenAIError as exc:
-            self.finished.emit(False, exc)
+            _API_KEY_CACHE.pop(digest, None)
+            self.signals.finished.emit(False, exc)
         except Exception as exc:  # pragma: no cover - defensive
-            self.finished.emit(False, exc)
+            self.signals.finished.emit(False, exc)
         else:
-            self.finished.emit(True, None)
+            _API_KEY_CACHE.pop(digest, None)
+            if len(_API_KEY_CACHE) >= _API_KEY_CACHE_SIZE:
+                del _API_KEY_CACHE[next(iter(_API_KEY_CACHE))]
+            _API_KEY_CACHE[digest] = time.monotonic()
+            self.signals.finished.emit(True, None)
+
+
+class _MicrophoneScanSignals(QtCore.QObject):
+    devicesReady = QtCore.pyqtSignal(list)
+    failed = QtCore.pyqtSignal(str)
+
+
+class _MicrophoneScanRunnable(QtCore.QRunnable):
+    """Enumerate input devices on a pooled thread so the settings page never blocks on the audio host."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _MicrophoneScanSignals()
+
+    def run(self) -> None:
+        try:
+            devices = list_microphones()
+        except Exception as exc:  # pragma: no cover - defensive
+            self.signals.failed.emit(str(exc))
+        else:
+            self.signals.devicesReady.emit(devices)
+
+
+def _env_write_pool() -> QtCore.QThreadPool:
+    """Single-threaded pool so queued .env writes run one at a time, in submission order."""
+    global _ENV_WRITE_POOL
+    if _ENV_WRITE_POOL is None:
+        _ENV_WRITE_POOL = QtCore.QThreadPool()
+        _ENV_WRITE_POOL.setMaxThreadCount(1)
+    return _ENV_WRITE_POOL
 
 
 def _update_env_file(key: str, value: str) -> None:
-    lines: list[str] = []
-    updated = False
-    if _ENV_FILE_PATH.exists():
-        existing = _ENV_FILE_PATH.read_text(encoding="utf-8").splitlines()
-        for line in existing:
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                lines.append(line)
-                continue
-            current_key, sep, _ = line.partition("=")
-            if sep and current_key.strip() == key:
-                lines.append(f"{key}={value}")
-                updated = True
-            else:
-                lines.append(line)
+    with _ENV_WRITE_LOCK:
+        _rewrite_env_file(key, value)
+
+
+def _rewrite_env_file(key: str, value: str) -> None:
+    new_line = f"{key}={value}"
+    text = _ENV_FILE_PATH.read_text(encoding="utf-8") if _ENV_FILE_PATH.exists() else ""
+    pattern = _ENV_KEY_PATTERNS.get(key)
+    if pattern is None:
+        pattern = _ENV_KEY_PATTERNS.setdefault(key, re.compile(rf"(?m)^[ \t]*{re.escape(key)}[ \t]*=.*$"))
+    match = pattern.search(text)
+    if match is not None:
+        if match.group(0) == new_line:
+            return
+        text = f"{text[:match.start()]}{new_line}{text[match.end():]}"
     else:
-        lines = []
-    if not updated:
-        lines.append(f"{key}={value}")
+        if text and not text.endswith("\n"):
+            text += "\n"
+        text += new_line + "\n"
     _ENV_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    _ENV_FILE_PATH.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # Write a uniquely named sibling and swap it in so a crash mid-write never leaves a truncated .env behind.
+    fd, tmp_name = tempfile.mkstemp(prefix=".env.", suffix=".tmp", dir=_ENV_FILE_PATH.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(tmp_name, _ENV_FILE_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:  # pragma: no cover - already moved or removed
+            pass
+        raise
 
 
 class ControlPanelWindow(QtWidgets.QMainWindow):
@@ -129,6 +255,7 @@ class ControlPanelWindow(QtWidgets.QMainWindow):
         palette.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor("#f7f6fb"))
         self.setPalette(palette)
         self.setAutoFillBackground(True)
+        self.setStyleSheet(_PANEL_STYLESHEET)
 
     def _build_sidebar(self) -> QtWidgets.QFrame:
         frame = QtWidgets.QFrame()
@@ -178,26 +305,7 @@ class SidebarButton(QtWidgets.QPushButton):
         self.setCheckable(True)
         self.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
         self.setMinimumHeight(40)
-        self.setStyleSheet(
-            """
-            QPushButton {
-                border: none;
-                border-radius: 12px;
-                text-align: left;
-                padding: 6px 14px;
-                font-size: 14px;
-                font-weight: 500;
-                color: #4f4669;
-            }
-            QPushButton:hover {
-                background-color: #e9e4fb;
-            }
-            QPushButton:checked {
-                background-color: #4332d8;
-                color: white;
-            }
-            """
-        )
+        self.setObjectName("SidebarButton")
 
 
 class DashboardPage(QtWidgets.QWidget):
@@ -206,12 +314,11 @@ class DashboardPage(QtWidgets.QWidget):
     def __init__(
         self,
         name: str,
-        entries: Sequence[TranscriptionEntry],
+        entries: Iterable[TranscriptionEntry],
         total_words: int,
         parent: Optional[QtWidgets.QWidget] = None,
     ) -> None:
         super().__init__(parent)
-        self._entries = list(entries)
         self._total_words = total_words
 
         layout = QtWidgets.QVBoxLayout(self)
@@ -233,8 +340,9 @@ class DashboardPage(QtWidgets.QWidget):
 
         layout.addWidget(_hint_banner())
 
+        # The history model is the only owner of the entries; they are streamed into it in a single pass.
         self._history_list = HistoryListWidget()
-        self._history_list.set_entries(self._entries)
+        self._history_list.set_entries(entries)
         layout.addWidget(self._history_list, 1)
 
     def refresh_stats(self, words: int) -> None:
@@ -242,7 +350,6 @@ class DashboardPage(QtWidgets.QWidget):
         self._words_badge.set_value(f"{words:,}")
 
     def add_entry(self, entry: TranscriptionEntry) -> None:
-        self._entries.insert(0, entry)
         self._total_words += entry.words
         self._words_badge.set_value(f"{self._total_words:,}")
         self._history_list.prepend_entry(entry)
@@ -254,22 +361,13 @@ class StatBadge(QtWidgets.QFrame):
     def __init__(self, label: str, value: str, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.setObjectName("StatBadge")
-        self.setStyleSheet(
-            """
-            QFrame#StatBadge {
-                background-color: white;
-                border-radius: 14px;
-                border: 1px solid #ded9f4;
-            }
-            """
-        )
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(16, 14, 16, 14)
         layout.setSpacing(4)
         label_widget = QtWidgets.QLabel(label)
-        label_widget.setStyleSheet("color: #6f6591; font-size: 12px;")
+        label_widget.setObjectName("StatBadgeLabel")
         self._value_widget = QtWidgets.QLabel(value)
-        self._value_widget.setStyleSheet("font-size: 20px; font-weight: 600; color: #2f254d;")
+        self._value_widget.setObjectName("StatBadgeValue")
         layout.addWidget(label_widget)
         layout.addWidget(self._value_widget)
 
@@ -277,83 +375,205 @@ class StatBadge(QtWidgets.QFrame):
         self._value_widget.setText(value)
 
 
-class HistoryListWidget(QtWidgets.QScrollArea):
-    """Scrollable list of transcription history items grouped by day."""
+class _HistoryRow:
+    """An entry row with its display strings, plus the wrapped text height for the width last laid out at."""
 
-    def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
+    __slots__ = ("entry", "text", "time_text", "words_text", "wrap_width", "wrap_height")
+
+    def __init__(self, entry: TranscriptionEntry) -> None:
+        # Labels are formatted once here so repaints never go back through the formatting caches.
+        self.entry = entry
+        self.text = entry.text.strip()
+        self.time_text = _format_time(entry.timestamp)
+        self.words_text = f"{entry.words} words"
+        self.wrap_width = -1
+        self.wrap_height = 0
+
+
+class HistoryModel(QtCore.QAbstractListModel):
+    """Flat list model of day headers and transcription entries, newest first."""
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
         super().__init__(parent)
-        self.setWidgetResizable(True)
-        self.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # Each row is either a day label (str) or an entry shown beneath it.
+        self._rows: list[object] = []
 
-        self._entries: list[TranscriptionEntry] = []
-        self._container = QtWidgets.QWidget()
-        self._layout = QtWidgets.QVBoxLayout(self._container)
-        self._layout.setContentsMargins(0, 0, 0, 0)
-        self._layout.setSpacing(8)
-        self._layout.addStretch(1)
-        self.setWidget(self._container)
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
 
-    def set_entries(self, entries: Sequence[TranscriptionEntry]) -> None:
-        self._entries = list(entries)
-        self._rebuild()
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> object:
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        row = self._rows[index.row()]
+        return row if isinstance(row, str) else row.text
 
-    def prepend_entry(self, entry: TranscriptionEntry) -> None:
-        self._entries.insert(0, entry)
-        self._rebuild()
-
-    def _clear_layout(self) -> None:
-        while self._layout.count():
-            item = self._layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-
-    def _rebuild(self) -> None:
-        self._clear_layout()
+    def row_at(self, row: int) -> object:
+        """Return the day label or entry at ``row`` without a QVariant round trip."""
+        return self._rows[row]
+
+    def set_entries(self, entries: Iterable[TranscriptionEntry]) -> None:
+        rows: list[object] = []
         last_header = None
-        for entry in self._entries:
+        for entry in entries:
             day_label = _format_day(entry.timestamp)
             if day_label != last_header:
-                header = QtWidgets.QLabel(day_label)
-                header.setStyleSheet("margin-top: 12px; font-size: 12px; font-weight: 600; color: #8c85a3;")
-                self._layout.addWidget(header)
+                rows.append(day_label)
                 last_header = day_label
-            self._layout.addWidget(HistoryItem(entry))
-        self._layout.addStretch(1)
-
+            rows.append(_HistoryRow(entry))
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
 
-class HistoryItem(QtWidgets.QFrame):
-    """Visual representation of a single transcription entry."""
+    def prepend_entry(self, entry: TranscriptionEntry) -> None:
+        day_label = _format_day(entry.timestamp)
+        if self._rows and self._rows[0] == day_label:
+            self.beginInsertRows(QtCore.QModelIndex(), 1, 1)
+            self._rows.insert(1, _HistoryRow(entry))
+        else:
+            self.beginInsertRows(QtCore.QModelIndex(), 0, 1)
+            self._rows[0:0] = [day_label, _HistoryRow(entry)]
+        self.endInsertRows()
+
+
+class HistoryItemDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints history rows as cards so the list never holds per-entry widgets."""
+
+    CARD_GAP = 8
+    CARD_MARGIN_X = 16
+    CARD_MARGIN_Y = 12
+    COLUMN_SPACING = 16
+    HEADER_TOP = 12
+
+    def __init__(self, view: QtWidgets.QListView) -> None:
+        super().__init__(view)
+        self._view = view
+        base = view.font()
+        self._header_font = QtGui.QFont(base)
+        self._header_font.setPixelSize(12)
+        self._header_font.setWeight(QtGui.QFont.Weight.DemiBold)
+        self._time_font = QtGui.QFont(base)
+        self._time_font.setWeight(QtGui.QFont.Weight.DemiBold)
+        self._text_font = QtGui.QFont(base)
+        self._words_font = QtGui.QFont(base)
+        self._words_font.setPixelSize(12)
+        # Metrics are fixed per font, so measure with one shared instance each instead of rebuilding them per row.
+        self._time_metrics = QtGui.QFontMetrics(self._time_font)
+        self._text_metrics = QtGui.QFontMetrics(self._text_font)
+        self._words_metrics = QtGui.QFontMetrics(self._words_font)
+        self._header_height = self.HEADER_TOP + QtGui.QFontMetrics(self._header_font).height() + self.CARD_GAP
+        self._col_header = QtGui.QColor("#8c85a3")
+        self._col_time = QtGui.QColor("#574d72")
+        self._col_text = QtGui.QColor("#42385f")
+        self._col_words = QtGui.QColor("#8c85a3")
+        self._card_brush = QtGui.QBrush(QtGui.QColor("white"))
+        self._card_pen = QtGui.QPen(QtGui.QColor("#ece8fb"), 1)
+        v_centre = QtCore.Qt.AlignmentFlag.AlignVCenter
+        self._header_flags = QtCore.Qt.AlignmentFlag.AlignLeft | v_centre
+        self._time_flags = QtCore.Qt.AlignmentFlag.AlignLeft | v_centre
+        self._text_flags = self._time_flags.value | QtCore.Qt.TextFlag.TextWordWrap.value
+        self._words_flags = QtCore.Qt.AlignmentFlag.AlignRight | v_centre
+
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        row = index.model().row_at(index.row())
+        width = self._view.viewport().width()
+        if isinstance(row, str):
+            return QtCore.QSize(width, self._header_height)
+        _, text_width, _ = self._columns(row, width)
+        content = max(self._time_metrics.height(), self._text_height(row, text_width))
+        return QtCore.QSize(width, content + 2 * self.CARD_MARGIN_Y + self.CARD_GAP)
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
+        row = index.model().row_at(index.row())
+        rect = option.rect
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        if isinstance(row, str):
+            painter.setFont(self._header_font)
+            painter.setPen(self._col_header)
+            header_rect = rect.adjusted(0, self.HEADER_TOP, 0, -self.CARD_GAP)
+            painter.drawText(header_rect, self._header_flags, row)
+            painter.restore()
+            return
 
-    def __init__(self, entry: TranscriptionEntry, parent: Optional[QtWidgets.QWidget] = None) -> None:
-        super().__init__(parent)
-        self.setObjectName("HistoryItem")
-        self.setStyleSheet(
-            """
-            QFrame#HistoryItem {
-                background-color: white;
-                border-radius: 12px;
-                border: 1px solid #ece8fb;
-            }
-            """
+        card = QtCore.QRectF(rect.adjusted(0, 0, 0, -self.CARD_GAP)).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(self._card_pen)
+        painter.setBrush(self._card_brush)
+        painter.drawRoundedRect(card, 12.0, 12.0)
+
+        time_width, text_width, words_width = self._columns(row, rect.width())
+        inner = rect.adjusted(self.CARD_MARGIN_X, self.CARD_MARGIN_Y, -self.CARD_MARGIN_X, -self.CARD_MARGIN_Y - self.CARD_GAP)
+        painter.setFont(self._time_font)
+        painter.setPen(self._col_time)
+        painter.drawText(
+            QtCore.QRect(inner.left(), inner.top(), time_width, inner.height()),
+            self._time_flags,
+            row.time_text,
         )
-        layout = QtWidgets.QHBoxLayout(self)
-        layout.setContentsMargins(16, 12, 16, 12)
-        layout.setSpacing(16)
-
-        time_label = QtWidgets.QLabel(_format_time(entry.timestamp))
-        time_label.setStyleSheet("font-weight: 600; color: #574d72;")
-        layout.addWidget(time_label)
+        painter.setFont(self._text_font)
+        painter.setPen(self._col_text)
+        painter.drawText(
+            QtCore.QRect(inner.left() + time_width + self.COLUMN_SPACING, inner.top(), text_width, inner.height()),
+            self._text_flags,
+            row.text,
+        )
+        painter.setFont(self._words_font)
+        painter.setPen(self._col_words)
+        painter.drawText(
+            QtCore.QRect(inner.right() - words_width + 1, inner.top(), words_width, inner.height()),
+            self._words_flags,
+            row.words_text,
+        )
+        painter.restore()
+
+    def _columns(self, row: _HistoryRow, width: int) -> tuple[int, int, int]:
+        time_width = self._time_metrics.horizontalAdvance(row.time_text)
+        words_width = self._words_metrics.horizontalAdvance(row.words_text)
+        text_width = width - 2 * self.CARD_MARGIN_X - 2 * self.COLUMN_SPACING - time_width - words_width
+        return time_width, max(1, text_width), words_width
+
+    def _text_height(self, row: _HistoryRow, width: int) -> int:
+        # Wrapping is the expensive part of layout; each row keeps its result until the width changes.
+        if row.wrap_width != width:
+            bounds = self._text_metrics.boundingRect(
+                QtCore.QRect(0, 0, width, 0),
+                QtCore.Qt.TextFlag.TextWordWrap.value,
+                row.text,
+            )
+            row.wrap_width = width
+            row.wrap_height = bounds.height()
+        return row.wrap_height
+
+
+class HistoryListWidget(QtWidgets.QListView):
+    """Virtualised list of transcription history items grouped by day."""
 
-        text_label = QtWidgets.QLabel(entry.text.strip())
-        text_label.setWordWrap(True)
-        text_label.setStyleSheet("color: #42385f;")
-        layout.addWidget(text_label, 1)
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
+        self.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.setResizeMode(QtWidgets.QListView.ResizeMode.Adjust)
+        self.setStyleSheet("QListView { background: transparent; }")
+        # Lay rows out in batches from the event loop so a long history never freezes the panel.
+        self.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+        self.setBatchSize(50)
+
+        # Only visible rows are painted, so memory and paint cost no longer scale with history size.
+        self._model = HistoryModel(self)
+        self.setModel(self._model)
+        self.setItemDelegate(HistoryItemDelegate(self))
+
+    def set_entries(self, entries: Iterable[TranscriptionEntry]) -> None:
+        self.setUpdatesEnabled(False)
+        try:
+            self._model.set_entries(entries)
+        finally:
+            self.setUpdatesEnabled(True)
 
-        words_label = QtWidgets.QLabel(f"{entry.words} words")
-        words_label.setStyleSheet("color: #8c85a3; font-size: 12px;")
-        layout.addWidget(words_label)
+    def prepend_entry(self, entry: TranscriptionEntry) -> None:
+        self._model.prepend_entry(entry)
 
 
 class SettingsPage(QtWidgets.QWidget):
@@ -364,10 +584,11 @@ class SettingsPage(QtWidgets.QWidget):
         self._config = config
         self._on_save = on_save
         self._api_key = config.resolve_api_key() or ""
-        self._api_test_thread: Optional[QtCore.QThread] = None
-        self._api_test_worker: Optional[_ApiTestWorker] = None
+        self._api_test_signals: Optional[_ApiTestSignals] = None
         self._pending_api_key: Optional[str] = None
         self._mic_warning_shown = False
+        self._mic_scan_signals: Optional[_MicrophoneScanSignals] = None
+        self._mic_scan_pending: Optional[str] = config.mic_device_name
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(36, 32, 36, 32)
@@ -459,11 +680,7 @@ class SettingsPage(QtWidgets.QWidget):
         self._apply_config()
 
     def _apply_config(self) -> None:
-        if self._config.mic_device_name:
-            index = self.mic_combo.findText(self._config.mic_device_name)
-            if index >= 0:
-                self.mic_combo.setCurrentIndex(index)
-
+        # The microphone selection is restored when the asynchronous device scan completes.
         language_index = self.language_combo.findData(self._config.language)
         if language_index >= 0:
             self.language_combo.setCurrentIndex(language_index)
@@ -475,22 +692,44 @@ class SettingsPage(QtWidgets.QWidget):
         self.api_key_edit.setText(self._api_key)
 
     def _populate_microphones(self) -> None:
-        current = self.mic_combo.currentText()
+        if self._mic_scan_signals is not None:
+            return
+        # Remember the selection to restore; before the first scan completes that is the saved device.
+        if self._mic_scan_pending is None and self.mic_combo.count():
+            self._mic_scan_pending = self.mic_combo.currentData()
+        self.mic_combo.clear()
+        self.mic_combo.addItem("Loading devices…", userData=self._mic_scan_pending)
+        self.mic_combo.setEnabled(False)
+        self.refresh_mics_button.setEnabled(False)
+
+        runnable = _MicrophoneScanRunnable()
+        self._mic_scan_signals = runnable.signals
+        runnable.signals.devicesReady.connect(self._on_microphones_ready)
+        runnable.signals.failed.connect(self._on_microphones_failed)
+        QtCore.QThreadPool.globalInstance().start(runnable)
+
+    @QtCore.pyqtSlot(list)
+    def _on_microphones_ready(self, devices: list) -> None:
+        self._mic_warning_shown = False
+        self._fill_microphones(devices)
+
+    @QtCore.pyqtSlot(str)
+    def _on_microphones_failed(self, error: str) -> None:
+        logger.bind(error=error).warning("Failed to refresh microphone list")
+        if not self._mic_warning_shown:
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Microphones",
+                "Unable to refresh microphone list. The system default input will be used.",
+            )
+            self._mic_warning_shown = True
+        self._fill_microphones([])
+
+    def _fill_microphones(self, devices: Sequence[str]) -> None:
+        current = self._mic_scan_pending
+        self._mic_scan_pending = None
+        self._mic_scan_signals = None
         self.mic_combo.clear()
-        try:
-            devices = list_microphones()
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.bind(error=str(exc)).warning("Failed to refresh microphone list")
-            if not self._mic_warning_shown:
-                QtWidgets.QMessageBox.warning(
-                    self,
-                    "Microphones",
-                    "Unable to refresh microphone list. The system default input will be used.",
-                )
-                self._mic_warning_shown = True
-            devices = []
-        else:
-            self._mic_warning_shown = False
         self.mic_combo.addItem("System Default", userData=None)
         for device in devices:
             self.mic_combo.addItem(device, userData=device)
@@ -498,6 +737,8 @@ class SettingsPage(QtWidgets.QWidget):
             idx = self.mic_combo.findText(current)
             if idx >= 0:
                 self.mic_combo.setCurrentIndex(idx)
+        self.mic_combo.setEnabled(True)
+        self.refresh_mics_button.setEnabled(True)
 
     def _update_gain_label(self, value: int) -> None:
         db_value = value / 10.0
@@ -519,14 +760,18 @@ class SettingsPage(QtWidgets.QWidget):
         self._on_save(config)
 
     def _set_api_key(self, api_key: str) -> None:
-        import os
-
         os.environ[self._config.api_key_env] = api_key
         self._api_key = api_key
-        try:
-            _update_env_file(self._config.api_key_env, api_key)
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.bind(error=str(exc)).warning("Failed to update .env file with new API key.")
+        env_key = self._config.api_key_env
+
+        def persist() -> None:
+            try:
+                _update_env_file(env_key, api_key)
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.bind(error=str(exc)).warning("Failed to update .env file with new API key.")
+
+        # The environment is updated synchronously above; the file write happens off the UI thread.
+        _env_write_pool().start(persist)
 
     def _handle_test_api(self) -> None:
         api_key = self.api_key_edit.text().strip()
@@ -534,24 +779,17 @@ class SettingsPage(QtWidgets.QWidget):
             QtWidgets.QMessageBox.warning(self, "OpenAI", "Enter an API key first.")
             return
 
-        if self._api_test_thread and self._api_test_thread.isRunning():
+        if self._api_test_signals is not None:
             return
 
         self._pending_api_key = api_key
         self.test_api_button.setEnabled(False)
         self.test_api_button.setText("Testing...")
 
-        worker = _ApiTestWorker(api_key)
-        thread = QtCore.QThread(self)
-        self._api_test_worker = worker
-        self._api_test_thread = thread
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
-        worker.finished.connect(self._on_api_test_finished)
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
-        thread.start()
+        runnable = _ApiTestRunnable(api_key)
+        self._api_test_signals = runnable.signals
+        runnable.signals.finished.connect(self._on_api_test_finished)
+        QtCore.QThreadPool.globalInstance().start(runnable)
 
     @QtCore.pyqtSlot(bool, object)
     def _on_api_test_finished(self, success: bool, error: object) -> None:
@@ -571,8 +809,7 @@ class SettingsPage(QtWidgets.QWidget):
                 logger.error("OpenAI test failed with unknown error")
 
         self._pending_api_key = None
-        self._api_test_worker = None
-        self._api_test_thread = None
+        self._api_test_signals = None
 
 
 class TrayController(QtWidgets.QSystemTrayIcon):
@@ -608,52 +845,50 @@ def _wrap_layout(widgets: Sequence[tuple[QtWidgets.QWidget, int]]) -> QtWidgets.
     return container
 
 
-def _format_day(timestamp: QtCore.QDateTime | object) -> str:
+def _to_datetime(timestamp: QtCore.QDateTime | object) -> object:
     if isinstance(timestamp, QtCore.QDateTime):
-        dt = timestamp.toPyDateTime()
-    else:
-        dt = timestamp  # type: ignore[assignment]
-    if hasattr(dt, "astimezone"):
-        local = dt.astimezone()
-    else:  # pragma: no cover - unexpected types
-        local = dt
-    return local.strftime("%A, %B %d, %Y")
+        return timestamp.toPyDateTime()
+    return timestamp
+
+
+# Both labels have minute resolution, so they are memoised per epoch minute rather than per timestamp.
+@functools.lru_cache(maxsize=4096)
+def _format_day_minute(minute: int) -> str:
+    return datetime.fromtimestamp(minute * 60).strftime("%A, %B %d, %Y")
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_time_minute(minute: int) -> str:
+    return datetime.fromtimestamp(minute * 60).strftime("%I:%M %p").lstrip("0")
+
+
+def _format_day(timestamp: QtCore.QDateTime | object) -> str:
+    dt = _to_datetime(timestamp)
+    if isinstance(dt, datetime):
+        return _format_day_minute(int(dt.timestamp()) // 60)
+    return dt.strftime("%A, %B %d, %Y")  # pragma: no cover - unexpected types
 
 
 def _format_time(timestamp: QtCore.QDateTime | object) -> str:
-    if isinstance(timestamp, QtCore.QDateTime):
-        dt = timestamp.toPyDateTime()
-    else:
-        dt = timestamp  # type: ignore[assignment]
-    if hasattr(dt, "astimezone"):
-        local = dt.astimezone()
-    else:  # pragma: no cover - unexpected types
-        local = dt
-    return local.strftime("%I:%M %p").lstrip("0")
+    dt = _to_datetime(timestamp)
+    if isinstance(dt, datetime):
+        return _format_time_minute(int(dt.timestamp()) // 60)
+    return dt.strftime("%I:%M %p").lstrip("0")  # pragma: no cover - unexpected types
 
 
 def _hint_banner() -> QtWidgets.QFrame:
     frame = QtWidgets.QFrame()
     frame.setObjectName("HintBanner")
-    frame.setStyleSheet(
-        """
-        QFrame#HintBanner {
-            background-color: #fef5d8;
-            border-radius: 16px;
-            border: 1px solid #f7d88a;
-        }
-        """
-    )
     layout = QtWidgets.QVBoxLayout(frame)
     layout.setContentsMargins(24, 24, 24, 24)
     layout.setSpacing(12)
     headline = QtWidgets.QLabel("Hold down Ctrl+Win to dictate in any app")
-    headline.setStyleSheet("font-size: 18px; font-weight: 600; color: #3b2f09;")
+    headline.setObjectName("HintBannerHeadline")
     body = QtWidgets.QLabel(
         "Dictate into email, documents, or messages. Keep holding the shortcut to capture your thoughts instantly."
     )
     body.setWordWrap(True)
-    body.setStyleSheet("color: #6d5723; font-size: 13px;")
+    body.setObjectName("HintBannerBody")
     layout.addWidget(headline)
     layout.addWidget(body)
     return frame
@@ -666,6 +901,6 @@ def _friendly_username() -> str:
         return ""
 
 
+@functools.lru_cache(maxsize=None)
 def _asset_path(name: str) -> Path:
-    base = Path(__file__).resolve().parent.parent / "assets"
-    return base / name
+    return _ASSET_DIR / name
@@ -2,41 +2,74 @@
 
 from __future__ import annotations
 
+import math
 from collections import deque
-from typing import Deque, Iterable
+from typing import Deque, Dict, Iterable, Union
 
 import numpy as np
 
+# Full-scale value per integer sample dtype, so ``np.iinfo`` is built once per format.
+_FULL_SCALE: Dict[np.dtype, int] = {}
 
-def rms_level(frame: bytes, dtype: np.dtype = np.int16) -> float:
-    """Return root-mean-square amplitude in linear scale."""
-    if not frame:
-        return 0.0
-    samples = np.frombuffer(frame, dtype=dtype).astype(np.float32)
-    if samples.size == 0:
+
+def rms_level(frame: Union[bytes, np.ndarray], dtype: np.dtype = np.int16) -> float:
+    """Return root-mean-square amplitude in linear scale.
+
+    ``frame`` may be raw PCM bytes or an integer ndarray; arrays are read in place.
+    """
+    if isinstance(frame, np.ndarray):
+        dtype = frame.dtype
+        raw = frame if frame.ndim == 1 else frame.reshape(-1)
+    else:
+        if not frame:
+            return 0.0
+        raw = np.frombuffer(frame, dtype=dtype)
+    if raw.size == 0:
         return 0.0
-    rms = np.sqrt(np.mean(np.square(samples)))
-    max_val = np.iinfo(dtype).max
-    return float(rms / max_val)
+    # Frames are a few hundred samples, so per-call dispatch dominates: one widening copy plus a BLAS dot
+    # beats einsum's setup. float64 sums int16 squares exactly for frames of up to ~8M samples.
+    wide = raw.astype(np.float64)
+    sum_squares = float(wide.dot(wide))
+    max_val = _FULL_SCALE.get(raw.dtype)
+    if max_val is None:
+        max_val = _FULL_SCALE.setdefault(raw.dtype, int(np.iinfo(raw.dtype).max))
+    return math.sqrt(sum_squares / raw.size) / max_val
 
 
 class LevelSmoother:
     """Smooth RMS levels for responsive UI animation."""
 
     def __init__(self, window: int = 6) -> None:
+        if window < 1:
+            raise ValueError(f"LevelSmoother window must be at least 1, got {window}")
         self._values: Deque[float] = deque(maxlen=window)
+        self._window = window
+        self._sum = 0.0
+        self._since_resync = 0
 
     def push(self, value: float) -> float:
         """Add a new sample and return the smoothed value."""
+        # Keep a running window sum so each push is O(1) instead of re-averaging the deque.
+        if len(self._values) == self._window:
+            self._sum -= self._values[0]
         self._values.append(value)
-        if not self._values:
-            return 0.0
-        arr = np.array(self._values, dtype=np.float32)
-        return float(np.mean(arr))
+        self._since_resync += 1
+        if self._since_resync >= self._window:
+            # Re-derive the sum once per window so add/subtract rounding error cannot accumulate.
+            self._since_resync = 0
+            self._sum = float(sum(self._values))
+        else:
+            self._sum += value
+        # Levels are non-negative; clamp away any residual rounding below zero.
+        return max(0.0, self._sum / len(self._values))
 
     def bulk_push(self, iterable: Iterable[float]) -> float:
         """Push multiple samples and return the latest smoothed level."""
-        smoothed = 0.0
-        for value in iterable:
-            smoothed = self.push(value)
-        return smoothed
+        values = list(iterable)
+        if not values:
+            return 0.0
+        # Only the trailing window survives, so append just that and re-derive the sum once.
+        self._values.extend(values[-self._window :])
+        self._sum = float(sum(self._values))
+        self._since_resync = 0
+        return max(0.0, self._sum / len(self._values))
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
+import sys
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Union
 
 from loguru import logger
 
@@ -14,22 +15,37 @@ from whisperfree.config import CONFIG_DIR
 
 LOG_PATH = CONFIG_DIR / "whisperfree.log"
 
+# Stdlib level name -> Loguru level (name, or the numeric level when Loguru has no such name).
+_LEVEL_CACHE: Dict[str, Union[str, int]] = {}
+# Lowest level any sink accepts; records below it are dropped before their message is formatted.
+_min_levelno = 0
+_bind = logger.bind
+
+
+def _resolve_level(record: logging.LogRecord) -> Union[str, int]:
+    try:
+        level: Union[str, int] = logger.level(record.levelname).name
+    except ValueError:
+        level = record.levelno
+    _LEVEL_CACHE[record.levelname] = level
+    return level
+
 
 class InterceptHandler(logging.Handler):
     """Forward stdlib logging records into Loguru."""
 
     def emit(self, record: logging.LogRecord) -> None:  # noqa: D401
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-        logger.bind(module=record.module).opt(depth=6, exception=record.exc_info).log(
-            level, record.getMessage()
-        )
+        if record.levelno < _min_levelno:
+            return
+        level = _LEVEL_CACHE.get(record.levelname)
+        if level is None:
+            level = _resolve_level(record)
+        _bind(module=record.module).opt(depth=6, exception=record.exc_info).log(level, record.getMessage())
 
 
 def setup_logging(level: str = "INFO") -> None:
     """Initialise log sinks and intercept stdlib logging."""
+    global _min_levelno
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
@@ -44,8 +60,11 @@ def setup_logging(level: str = "INFO") -> None:
         backtrace=False,
         diagnose=False,
     )
-    logger.add(lambda msg: print(msg, end=""), level=level)
+    # Write straight to the console stream (absent under pythonw); enqueue keeps console I/O off the caller's thread.
+    if sys.stderr is not None:
+        logger.add(sys.stderr.write, level=level, enqueue=True)
 
+    _min_levelno = logger.level(level).no
     logging.basicConfig(handlers=[InterceptHandler()], level=level)
 
 